@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 import argparse
+import codecs
 import sys
 import threading
-import time
 
 try:
     import serial
@@ -12,6 +12,8 @@ except ImportError as exc:
 
 
 def reader_loop(ser):
+    # Incremental decoder keeps multibyte sequences split across reads intact
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
     while True:
         try:
             data = ser.read(ser.in_waiting or 1)
@@ -20,12 +22,10 @@ def reader_loop(ser):
             break
         if data:
             try:
-                sys.stdout.write(data.decode("utf-8", errors="replace"))
+                sys.stdout.write(decoder.decode(data))
                 sys.stdout.flush()
             except Exception:
                 pass
-        else:
-            time.sleep(0.01)
 
 
 def main():
@@ -2,7 +2,6 @@
 import argparse
 import struct
 import sys
-import time
 
 try:
     import serial
@@ -13,21 +12,20 @@ except ImportError as exc:
 
 MAGIC = b"\x02\x01\x04\x03\x06\x05\x08\x07"
 HEADER_LEN = 40  # bytes after magic word for mmWave demo header
+HEADER_STRUCT = struct.Struct("<9I")
+MIN_FRAME_LEN = len(MAGIC) + HEADER_LEN
+MAX_FRAME_LEN = 1 << 18  # larger total_len values are treated as corrupt
 
 
-def find_magic(buf):
-    idx = buf.find(MAGIC)
-    if idx == -1:
-        # Keep only last 7 bytes to handle magic split across reads
-        return -1, buf[-7:]
-    return idx, buf
+def find_magic(buf, start=0):
+    return buf.find(MAGIC, start)
 
 
 def parse_header(buf, start):
     if len(buf) < start + len(MAGIC) + HEADER_LEN:
         return None
     off = start + len(MAGIC)
-    fields = struct.unpack_from("<9I", buf, off)
+    fields = HEADER_STRUCT.unpack_from(buf, off)
     version, total_len, platform, frame_num, cpu_cycles, num_obj, num_tlvs, subframe, reserved = fields
     return {
         "version": version,
@@ -54,41 +52,54 @@ def main():
         sys.stderr.write(f"Failed to open {args.port}: {exc}\n")
         return 1
 
-    buf = b""
+    buf = bytearray()
     last_frame = None
     try:
         while True:
-            chunk = ser.read(4096)
-            if chunk:
-                buf += chunk
-            else:
-                time.sleep(0.005)
+            # Block for the first byte (up to the port timeout), then drain
+            # whatever else is already buffered
+            chunk = ser.read(ser.in_waiting or 1)
+            if not chunk:
                 continue
-
-            idx, buf = find_magic(buf)
-            if idx == -1:
-                continue
-
-            hdr = parse_header(buf, idx)
-            if hdr is None:
-                continue
-
-            total_len = hdr["total_len"]
-            if len(buf) < idx + total_len:
-                continue
-
-            frame_num = hdr["frame_num"]
-            num_obj = hdr["num_obj"]
-            if frame_num != last_frame:
-                last_frame = frame_num
-                if args.quiet:
-                    sys.stdout.write(f"{num_obj}\n")
-                else:
-                    sys.stdout.write(f"frame {frame_num} objects {num_obj}\n")
-                sys.stdout.flush()
-
-            # drop processed packet
-            buf = buf[idx + total_len :]
+            buf.extend(chunk)
+
+            # Walk every complete packet in the buffer, then compact once
+            pos = 0
+            while True:
+                idx = find_magic(buf, pos)
+                if idx == -1:
+                    # Keep only last 7 bytes to handle magic split across reads
+                    pos = max(pos, len(buf) - (len(MAGIC) - 1))
+                    break
+                pos = idx
+
+                hdr = parse_header(buf, idx)
+                if hdr is None:
+                    break
+
+                total_len = hdr["total_len"]
+                if not MIN_FRAME_LEN <= total_len <= MAX_FRAME_LEN:
+                    # Corrupt length; resync past this magic word
+                    pos = idx + len(MAGIC)
+                    continue
+                if len(buf) < idx + total_len:
+                    break
+
+                frame_num = hdr["frame_num"]
+                num_obj = hdr["num_obj"]
+                if frame_num != last_frame:
+                    last_frame = frame_num
+                    if args.quiet:
+                        sys.stdout.write(f"{num_obj}\n")
+                    else:
+                        sys.stdout.write(f"frame {frame_num} objects {num_obj}\n")
+                    sys.stdout.flush()
+
+                # drop processed packet
+                pos = idx + total_len
+
+            if pos:
+                del buf[:pos]
     except KeyboardInterrupt:
         pass
     finally:
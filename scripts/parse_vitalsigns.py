@@ -36,19 +36,36 @@ TLV_TYPE_VITALSIGNS = 0x410
 
 # Header structure: 8 bytes magic + 32 bytes header = 40 bytes total
 HEADER_SIZE = 40
+HEADER_STRUCT = struct.Struct('<8I')
+
+# Upper bound on a sane total_packet_len; larger values are treated as corrupt
+MAX_FRAME_LEN = 1 << 18
+
+# MmwDemo_output_message_vitalsigns: uint16 x2, float x3, then valid + reserved[3]
+VITALSIGNS_STRUCT = struct.Struct('<HHfff')
+
+# TLV header: type, length
+TLV_HEADER_STRUCT = struct.Struct('<II')
+
+# CSV log layout
+LOG_HEADER = "timestamp,frame,heart_rate,breathing_rate,deviation,valid,range_bin,target_id\n"
+LOG_ROW_FORMAT = "%s,%d,%.2f,%.2f,%.6f,%d,%d,%d\n"
+
+# Flush the CSV log at most this often (seconds); close() flushes the rest
+LOG_FLUSH_INTERVAL = 1.0
 
 class VitalSignsOutput:
     """Vital signs output structure"""
+    __slots__ = ('target_id', 'range_bin', 'heart_rate', 'breathing_rate',
+                 'breathing_deviation', 'valid')
+
     def __init__(self, data):
         if len(data) < 20:
             raise ValueError(f"Invalid vital signs data length: {len(data)}")
 
         # Parse according to MmwDemo_output_message_vitalsigns structure
-        self.target_id = struct.unpack('<H', data[0:2])[0]
-        self.range_bin = struct.unpack('<H', data[2:4])[0]
-        self.heart_rate = struct.unpack('<f', data[4:8])[0]
-        self.breathing_rate = struct.unpack('<f', data[8:12])[0]
-        self.breathing_deviation = struct.unpack('<f', data[12:16])[0]
+        (self.target_id, self.range_bin, self.heart_rate,
+         self.breathing_rate, self.breathing_deviation) = VITALSIGNS_STRUCT.unpack_from(data, 0)
         self.valid = data[16]
         # reserved[3] at bytes 17-19
 
@@ -64,101 +81,93 @@ class VitalSignsOutput:
 
 class FrameHeader:
     """Frame header parser"""
+    __slots__ = ('version', 'total_packet_len', 'platform', 'frame_number',
+                 'time_cpu_cycles', 'num_detected_obj', 'num_tlvs', 'subframe_number')
+
     def __init__(self, data):
         if len(data) < HEADER_SIZE:
             raise ValueError(f"Invalid header length: {len(data)}")
 
         # Skip magic word (8 bytes)
-        offset = 8
-
-        self.version = struct.unpack('<I', data[offset:offset+4])[0]
-        offset += 4
-
-        self.total_packet_len = struct.unpack('<I', data[offset:offset+4])[0]
-        offset += 4
-
-        self.platform = struct.unpack('<I', data[offset:offset+4])[0]
-        offset += 4
-
-        self.frame_number = struct.unpack('<I', data[offset:offset+4])[0]
-        offset += 4
-
-        self.time_cpu_cycles = struct.unpack('<I', data[offset:offset+4])[0]
-        offset += 4
-
-        self.num_detected_obj = struct.unpack('<I', data[offset:offset+4])[0]
-        offset += 4
-
-        self.num_tlvs = struct.unpack('<I', data[offset:offset+4])[0]
-        offset += 4
-
-        self.subframe_number = struct.unpack('<I', data[offset:offset+4])[0]
+        (self.version, self.total_packet_len, self.platform,
+         self.frame_number, self.time_cpu_cycles, self.num_detected_obj,
+         self.num_tlvs, self.subframe_number) = HEADER_STRUCT.unpack_from(data, 8)
 
 
 def find_magic_word(ser, timeout=5.0):
     """Find magic word in serial stream"""
-    buffer = b''
+    buffer = bytearray()
     start_time = time.time()
 
     while time.time() - start_time < timeout:
-        if ser.in_waiting:
-            buffer += ser.read(ser.in_waiting)
-
-            # Look for magic word
-            idx = buffer.find(MAGIC_WORD)
-            if idx >= 0:
-                # Return data starting from magic word
-                return buffer[idx:]
-
-        time.sleep(0.001)
+        # Blocks for the first byte (up to the port timeout), then drains
+        # whatever else is already buffered
+        chunk = ser.read(ser.in_waiting or 1)
+        if not chunk:
+            continue
+        buffer.extend(chunk)
+
+        # Look for magic word
+        idx = buffer.find(MAGIC_WORD)
+        if idx >= 0:
+            # Return data starting from magic word
+            del buffer[:idx]
+            return buffer
+
+        # Keep only a possible partial magic word at the tail
+        del buffer[:-(len(MAGIC_WORD) - 1)]
 
     return None
 
 
 def read_frame(ser, timeout=1.0):
-    """Read a complete frame from serial port"""
+    """Read a complete frame from serial port, returning (header, data)"""
     # Find magic word
     data = find_magic_word(ser, timeout)
     if data is None:
         return None
 
-    # Read header if not complete
+    # Read header if not complete (read blocks until filled or timeout)
     while len(data) < HEADER_SIZE:
-        if ser.in_waiting:
-            data += ser.read(min(HEADER_SIZE - len(data), ser.in_waiting))
-        time.sleep(0.001)
+        data += ser.read(HEADER_SIZE - len(data))
 
     # Parse header to get total length
     header = FrameHeader(data)
+    if not HEADER_SIZE <= header.total_packet_len <= MAX_FRAME_LEN:
+        # Corrupt length; drop this frame and resync on the next magic word
+        return None
 
-    # Read remaining data
-    while len(data) < header.total_packet_len:
-        if ser.in_waiting:
-            remaining = header.total_packet_len - len(data)
-            data += ser.read(min(remaining, ser.in_waiting))
-        time.sleep(0.001)
+    # Read remaining data straight into a buffer of the final frame size
+    frame = bytearray(header.total_packet_len)
+    written = min(len(data), len(frame))
+    frame[:written] = data[:written]
+    with memoryview(frame) as view:
+        while written < len(frame):
+            written += ser.readinto(view[written:])
 
-    return data
+    return header, frame
 
 
 def parse_tlvs(data, header):
     """Parse TLVs from frame data"""
     offset = HEADER_SIZE
     tlvs = {}
+    data_len = len(data)
+    unpack_tlv_header = TLV_HEADER_STRUCT.unpack_from
+    view = memoryview(data)
 
     for _ in range(header.num_tlvs):
-        if offset + 8 > len(data):
+        if offset + 8 > data_len:
             break
 
-        tlv_type = struct.unpack('<I', data[offset:offset+4])[0]
-        tlv_length = struct.unpack('<I', data[offset+4:offset+8])[0]
+        tlv_type, tlv_length = unpack_tlv_header(data, offset)
         offset += 8
 
-        if offset + tlv_length > len(data):
+        if offset + tlv_length > data_len:
             break
 
-        tlv_data = data[offset:offset+tlv_length]
-        tlvs[tlv_type] = tlv_data
+        # Payloads are zero-copy views into the frame buffer
+        tlvs[tlv_type] = view[offset:offset+tlv_length]
         offset += tlv_length
 
     return tlvs
@@ -183,35 +192,39 @@ def main():
     # Open log file if specified
     log_file = None
     if args.log:
-        log_file = open(args.log, 'w')
-        log_file.write("timestamp,frame,heart_rate,breathing_rate,deviation,valid,range_bin,target_id\n")
+        log_file = open(args.log, 'w', buffering=1 << 16)
+        log_file.write(LOG_HEADER)
         print(f"Logging to {args.log}")
 
+    last_flush = time.monotonic()
+
     print("Waiting for vital signs data...")
     print("Press Ctrl+C to stop\n")
 
     try:
         while True:
-            # Read frame
-            frame_data = read_frame(ser)
-            if frame_data is None:
-                continue
-
-            # Parse header
-            try:
-                header = FrameHeader(frame_data)
-            except ValueError as e:
-                if args.verbose:
-                    print(f"Header parse error: {e}")
+            # Checked every pass (read_frame returns within ~1 s on an idle
+            # port), so logged rows reach the file even when VS frames stop
+            if log_file:
+                now = time.monotonic()
+                if now - last_flush >= LOG_FLUSH_INTERVAL:
+                    log_file.flush()
+                    last_flush = now
+
+            # Read frame (header is parsed while reading)
+            frame = read_frame(ser)
+            if frame is None:
                 continue
+            header, frame_data = frame
 
             # Parse TLVs
             tlvs = parse_tlvs(frame_data, header)
 
             # Check for vital signs TLV
-            if TLV_TYPE_VITALSIGNS in tlvs:
+            vs_payload = tlvs.get(TLV_TYPE_VITALSIGNS)
+            if vs_payload is not None:
                 try:
-                    vs = VitalSignsOutput(tlvs[TLV_TYPE_VITALSIGNS])
+                    vs = VitalSignsOutput(vs_payload)
 
                     # Print to console
                     print(f"Frame {header.frame_number:5d}: {vs}")
@@ -219,11 +232,11 @@ def main():
                     # Log to file
                     if log_file:
                         timestamp = datetime.now().isoformat()
-                        log_file.write(f"{timestamp},{header.frame_number},"
-                                      f"{vs.heart_rate:.2f},{vs.breathing_rate:.2f},"
-                                      f"{vs.breathing_deviation:.6f},{vs.valid},"
-                                      f"{vs.range_bin},{vs.target_id}\n")
-                        log_file.flush()
+                        log_file.write(LOG_ROW_FORMAT % (
+                            timestamp, header.frame_number,
+                            vs.heart_rate, vs.breathing_rate,
+                            vs.breathing_deviation, vs.valid,
+                            vs.range_bin, vs.target_id))
 
                 except ValueError as e:
                     if args.verbose:
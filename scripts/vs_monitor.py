@@ -15,6 +15,8 @@ Author: IWR6843 RE Project
 """
 
 import argparse
+import codecs
+import functools
 import struct
 import serial
 import serial.tools.list_ports
@@ -23,8 +25,8 @@ import time
 import threading
 import queue
 import os
-from datetime import datetime
 from collections import deque
+from math import hypot, isfinite
 
 # =============================================================================
 # Constants
@@ -34,6 +36,8 @@ from collections import deque
 MAGIC_WORD = bytes([0x02, 0x01, 0x04, 0x03, 0x06, 0x05, 0x08, 0x07])
 
 # TLV Types
+TLV_TYPE_VITALSIGNS = 0x410
+
 TLV_TYPES = {
     1: "DETECTED_POINTS",
     2: "RANGE_PROFILE",
@@ -44,11 +48,43 @@ TLV_TYPES = {
     7: "DETECTED_POINTS_SIDE_INFO",
     8: "AZIMUTH_ELEVATION_STATIC_HEATMAP",
     9: "TEMPERATURE_STATS",
-    0x410: "VITAL_SIGNS",
+    TLV_TYPE_VITALSIGNS: "VITAL_SIGNS",
 }
 
+
+@functools.lru_cache(maxsize=64)
+def _tlv_name(tlv_type):
+    """Display name for a TLV type (unknown IDs as hex)"""
+    return TLV_TYPES.get(tlv_type) or f"0x{tlv_type:X}"
+
+
 # Header size (magic + header fields)
 HEADER_SIZE = 40
+HEADER_STRUCT = struct.Struct('<8I')
+
+# Upper bound on a sane total_packet_len; larger values are treated as corrupt
+MAX_FRAME_LEN = 1 << 18
+
+# Largest single serial read request while filling a frame
+SERIAL_READ_CHUNK = 4096
+
+# Vital signs TLV: target_id, range_bin, HR, BR, deviation (valid byte follows)
+VITALSIGNS_STRUCT = struct.Struct('<HHfff')
+
+# TLV header: type, length
+TLV_HEADER_STRUCT = struct.Struct('<II')
+
+# CSV log layout
+LOG_HEADER = "timestamp,frame,heart_rate,breathing_rate,deviation,valid,range_bin,target_id\n"
+LOG_ROW_FORMAT = "%s.%06d,%d,%.2f,%.2f,%.6f,%d,%d,%d\n"  # ISO timestamp as seconds prefix + usec
+
+# Flush the CSV log file at most this often (seconds); disconnect() flushes the rest
+LOG_FLUSH_INTERVAL = 1.0
+
+# Default profile for the interactive 'load' command
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_DEFAULT_CFG = os.path.normpath(os.path.join(
+    _SCRIPT_DIR, '..', 'configs', 'chirp_profiles', 'vital_signs_2m.cfg'))
 
 # ANSI colors for terminal output
 class Colors:
@@ -62,43 +98,53 @@ class Colors:
     BOLD = '\033[1m'
     DIM = '\033[2m'
 
+# Color codes used on per-frame paths, bound once as plain module globals
+_C_CYAN, _C_GREEN, _C_RED, _C_DIM, _C_END = (
+    Colors.CYAN, Colors.GREEN, Colors.RED, Colors.DIM, Colors.ENDC)
+
 # =============================================================================
 # Data Structures
 # =============================================================================
 
 class FrameHeader:
     """mmWave frame header parser"""
+    __slots__ = ('version', 'total_packet_len', 'platform', 'frame_number',
+                 'time_cpu_cycles', 'num_detected_obj', 'num_tlvs', 'subframe_number')
+
     def __init__(self, data):
         if len(data) < HEADER_SIZE:
             raise ValueError(f"Header too short: {len(data)} bytes")
 
-        offset = 8  # Skip magic word
-        self.version = struct.unpack('<I', data[offset:offset+4])[0]
-        self.total_packet_len = struct.unpack('<I', data[offset+4:offset+8])[0]
-        self.platform = struct.unpack('<I', data[offset+8:offset+12])[0]
-        self.frame_number = struct.unpack('<I', data[offset+12:offset+16])[0]
-        self.time_cpu_cycles = struct.unpack('<I', data[offset+16:offset+20])[0]
-        self.num_detected_obj = struct.unpack('<I', data[offset+20:offset+24])[0]
-        self.num_tlvs = struct.unpack('<I', data[offset+24:offset+28])[0]
-        self.subframe_number = struct.unpack('<I', data[offset+28:offset+32])[0]
+        # Fields start after the 8-byte magic word
+        (self.version, self.total_packet_len, self.platform,
+         self.frame_number, self.time_cpu_cycles, self.num_detected_obj,
+         self.num_tlvs, self.subframe_number) = HEADER_STRUCT.unpack_from(data, 8)
 
 
 class VitalSignsData:
     """Vital signs TLV data parser"""
+    __slots__ = ('target_id', 'range_bin', 'heart_rate', 'breathing_rate',
+                 'breathing_deviation', 'valid')
+    SIZE = 20
+
     def __init__(self, data):
-        if len(data) < 20:
+        if len(data) < self.SIZE:
             raise ValueError(f"VS data too short: {len(data)} bytes")
 
-        self.target_id = struct.unpack('<H', data[0:2])[0]
-        self.range_bin = struct.unpack('<H', data[2:4])[0]
-        self.heart_rate = struct.unpack('<f', data[4:8])[0]
-        self.breathing_rate = struct.unpack('<f', data[8:12])[0]
-        self.breathing_deviation = struct.unpack('<f', data[12:16])[0]
+        (self.target_id, self.range_bin, self.heart_rate,
+         self.breathing_rate, self.breathing_deviation) = VITALSIGNS_STRUCT.unpack_from(data, 0)
         self.valid = data[16]
         # reserved[3] at bytes 17-19
 
+    @classmethod
+    def try_parse(cls, data):
+        """Parse a VS TLV payload, or return None if it is too short"""
+        if len(data) < cls.SIZE:
+            return None
+        return cls(data)
+
     def __str__(self):
-        status = f"{Colors.GREEN}VALID{Colors.ENDC}" if self.valid else f"{Colors.RED}INVALID{Colors.ENDC}"
+        status = f"{_C_GREEN}VALID{_C_END}" if self.valid else f"{_C_RED}INVALID{_C_END}"
         return (f"[{status}] HR={self.heart_rate:6.1f} BPM | "
                 f"BR={self.breathing_rate:5.1f} BPM | "
                 f"Dev={self.breathing_deviation:.4f} | "
@@ -107,6 +153,8 @@ class VitalSignsData:
 
 class DetectedPoint:
     """Detected object point parser"""
+    __slots__ = ('x', 'y', 'z', 'doppler')
+
     def __init__(self, data, offset=0):
         self.x = struct.unpack('<f', data[offset:offset+4])[0]
         self.y = struct.unpack('<f', data[offset+4:offset+8])[0]
@@ -115,12 +163,38 @@ class DetectedPoint:
 
     @property
     def range(self):
-        return (self.x**2 + self.y**2 + self.z**2)**0.5
+        return hypot(self.x, self.y, self.z)
 
     def __str__(self):
         return f"({self.x:6.2f}, {self.y:6.2f}, {self.z:6.2f}) R={self.range:5.2f}m V={self.doppler:5.2f}m/s"
 
 
+class RunningAverage:
+    """Fixed-window moving average with O(1) updates; non-finite samples are skipped"""
+    __slots__ = ('_window', '_total')
+
+    def __init__(self, size):
+        self._window = deque(maxlen=size)
+        self._total = 0.0
+
+    def append(self, value):
+        # A single inf/NaN would poison the running total for good
+        if not isfinite(value):
+            return
+        window = self._window
+        if len(window) == window.maxlen:
+            self._total -= window[0]  # evicted by the append below
+        window.append(value)
+        self._total += value
+
+    def __len__(self):
+        return len(self._window)
+
+    @property
+    def mean(self):
+        return self._total / len(self._window) if self._window else 0
+
+
 # =============================================================================
 # Serial Port Management
 # =============================================================================
@@ -191,14 +265,16 @@ class CLIInterface:
     def _reader_loop(self):
         """Background thread to read CLI responses"""
         buffer = ""
+        # Incremental decoder keeps multibyte sequences split across reads intact
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
         while self.running and self.ser:
             try:
-                data = self.ser.read(1024)
+                data = self.ser.read(self.ser.in_waiting or 1)
                 if data:
-                    buffer += data.decode('utf-8', errors='replace')
+                    buffer += decoder.decode(data)
                     # Process complete lines
-                    while '\n' in buffer:
-                        line, buffer = buffer.split('\n', 1)
+                    *lines, buffer = buffer.split('\n')
+                    for line in lines:
                         line = line.strip()
                         if line:
                             self.response_queue.put(line)
@@ -292,9 +368,16 @@ class DataStreamParser:
         self.baud = baud
         self.ser = None
         self.running = False
-        self.frame_queue = queue.Queue(maxsize=100)
+        # Single producer/consumer: deque ops are atomic and maxlen drops
+        # the oldest frame when full; the event wakes a waiting consumer
+        self.frame_queue = deque(maxlen=100)
+        self.frame_ready = threading.Event()
         self.parser_thread = None
 
+        # Receive buffer shared across frames; bytes read past the end of a
+        # frame stay here as the start of the next one
+        self._rx_buf = bytearray()
+
         # Statistics
         self.frames_received = 0
         self.frames_with_vs = 0
@@ -305,6 +388,7 @@ class DataStreamParser:
         """Connect to data port"""
         self.ser = open_serial_port(self.port, self.baud)
         if self.ser:
+            self._enable_low_latency()
             self.running = True
             self.parser_thread = threading.Thread(target=self._parser_loop, daemon=True)
             self.parser_thread.start()
@@ -320,69 +404,97 @@ class DataStreamParser:
             self.ser.close()
             self.ser = None
 
+    def _enable_low_latency(self):
+        """Ask the USB-serial driver to skip its receive latency timer (Linux)"""
+        if not hasattr(self.ser, 'set_low_latency_mode'):
+            return
+        try:
+            self.ser.set_low_latency_mode(True)
+        except (OSError, ValueError) as e:
+            # Not all drivers support ASYNC_LOW_LATENCY; stream still works
+            print(f"{Colors.DIM}Low-latency mode unavailable on {self.port}: {e}{Colors.ENDC}")
+
     def _find_magic_word(self, timeout=1.0):
-        """Find magic word in stream"""
-        buffer = b''
+        """Find magic word in stream and align it to the start of the RX buffer"""
+        buffer = self._rx_buf
         start_time = time.time()
 
-        while self.running and time.time() - start_time < timeout:
-            if self.ser.in_waiting:
-                buffer += self.ser.read(self.ser.in_waiting)
-                idx = buffer.find(MAGIC_WORD)
-                if idx >= 0:
-                    return buffer[idx:]
-            time.sleep(0.001)
+        while self.running:
+            idx = buffer.find(MAGIC_WORD)
+            if idx >= 0:
+                del buffer[:idx]
+                return True
+            # Keep only a possible partial magic word at the tail
+            del buffer[:-(len(MAGIC_WORD) - 1)]
+
+            if time.time() - start_time >= timeout:
+                break
+            # Blocks for the first byte (up to the port timeout), then drains
+            # whatever else is already buffered
+            buffer.extend(self.ser.read(self.ser.in_waiting or 1))
 
-        return None
+        return False
+
+    def _fill_rx_buf(self, size):
+        """Read until the RX buffer holds at least size bytes"""
+        buffer = self._rx_buf
+        while len(buffer) < size and self.running:
+            # Read blocks until filled or timeout; anything already waiting
+            # past this frame is kept for the next one
+            want = min(size - len(buffer), SERIAL_READ_CHUNK)
+            buffer.extend(self.ser.read(max(want, self.ser.in_waiting)))
+        return len(buffer) >= size
 
     def _read_frame(self):
-        """Read a complete frame"""
+        """Read a complete frame, returning (header, data)"""
         # Find magic word
-        data = self._find_magic_word()
-        if data is None:
+        if not self._find_magic_word():
             return None
 
         # Read header if needed
-        while len(data) < HEADER_SIZE and self.running:
-            if self.ser.in_waiting:
-                data += self.ser.read(min(HEADER_SIZE - len(data), self.ser.in_waiting))
-            time.sleep(0.001)
-
-        if len(data) < HEADER_SIZE:
+        if not self._fill_rx_buf(HEADER_SIZE):
             return None
 
         # Parse header to get length
         try:
-            header = FrameHeader(data)
+            header = FrameHeader(self._rx_buf)
         except ValueError:
             return None
+        if not HEADER_SIZE <= header.total_packet_len <= MAX_FRAME_LEN:
+            # Corrupt length; skip this magic word and resync
+            del self._rx_buf[:len(MAGIC_WORD)]
+            return None
 
         # Read rest of frame
-        while len(data) < header.total_packet_len and self.running:
-            if self.ser.in_waiting:
-                remaining = header.total_packet_len - len(data)
-                data += self.ser.read(min(remaining, self.ser.in_waiting))
-            time.sleep(0.001)
+        if not self._fill_rx_buf(header.total_packet_len):
+            return None
 
-        return data
+        # Copy the frame out (TLV views outlive this buffer) and keep the residual
+        data = self._rx_buf[:header.total_packet_len]
+        del self._rx_buf[:header.total_packet_len]
+
+        return header, data
 
     def _parse_tlvs(self, data, header):
         """Parse TLVs from frame"""
         tlvs = {}
         offset = HEADER_SIZE
+        data_len = len(data)
+        unpack_tlv_header = TLV_HEADER_STRUCT.unpack_from
+        view = memoryview(data)
 
         for _ in range(header.num_tlvs):
-            if offset + 8 > len(data):
+            if offset + 8 > data_len:
                 break
 
-            tlv_type = struct.unpack('<I', data[offset:offset+4])[0]
-            tlv_length = struct.unpack('<I', data[offset+4:offset+8])[0]
+            tlv_type, tlv_length = unpack_tlv_header(data, offset)
             offset += 8
 
-            if offset + tlv_length > len(data):
+            if offset + tlv_length > data_len:
                 break
 
-            tlvs[tlv_type] = data[offset:offset+tlv_length]
+            # Payloads are zero-copy views into the frame buffer
+            tlvs[tlv_type] = view[offset:offset+tlv_length]
             offset += tlv_length
 
         return tlvs
@@ -391,11 +503,11 @@ class DataStreamParser:
         """Background thread to parse frames"""
         while self.running:
             try:
-                data = self._read_frame()
-                if data is None:
+                frame = self._read_frame()
+                if frame is None:
                     continue
 
-                header = FrameHeader(data)
+                header, data = frame
                 tlvs = self._parse_tlvs(data, header)
 
                 # Update statistics
@@ -405,15 +517,12 @@ class DataStreamParser:
                 self.last_frame_time = now
                 self.frames_received += 1
 
-                if 0x410 in tlvs:
+                if TLV_TYPE_VITALSIGNS in tlvs:
                     self.frames_with_vs += 1
 
-                # Queue frame for processing
-                try:
-                    self.frame_queue.put_nowait((header, tlvs))
-                except queue.Full:
-                    self.frame_queue.get()  # Drop oldest
-                    self.frame_queue.put_nowait((header, tlvs))
+                # Queue frame for processing (oldest is dropped when full)
+                self.frame_queue.append((header, tlvs))
+                self.frame_ready.set()
 
             except Exception as e:
                 if self.running:
@@ -421,9 +530,12 @@ class DataStreamParser:
 
     def get_frame(self, timeout=0.1):
         """Get next parsed frame"""
+        if not self.frame_queue:
+            self.frame_ready.wait(timeout)
+        self.frame_ready.clear()
         try:
-            return self.frame_queue.get(timeout=timeout)
-        except queue.Empty:
+            return self.frame_queue.popleft()
+        except IndexError:
             return None
 
     @property
@@ -448,13 +560,25 @@ class VitalSignsMonitor:
 
         self.running = False
         self.display_mode = 'vital_signs'  # vital_signs, all_tlvs, stats
+        self._tlv_sig = None        # TLV types of the last all_tlvs summary
+        self._tlv_sig_names = ""
+
+        # Per-frame status line; static color markup is baked in once
+        self._vs_status_format = (f"\r{_C_CYAN}Frame %6d{_C_END} | %s | "
+                                  f"Avg: HR=%5.1f BR=%4.1f")
+        # On a terminal, status lines are written straight to the fd
+        self._stdout_fd = sys.stdout.fileno() if sys.stdout.isatty() else None
 
         # Vital signs history for averaging
-        self.hr_history = deque(maxlen=10)
-        self.br_history = deque(maxlen=10)
+        self.hr_history = RunningAverage(10)
+        self.br_history = RunningAverage(10)
+        self._vs_err_count = 0      # VS TLVs too short to parse
 
         # Logging
         self.log_file = None
+        self._log_last_flush = time.monotonic()
+        self._ts_cached_sec = 0
+        self._ts_cached_prefix = ""
 
     def connect(self):
         """Connect to both ports"""
@@ -483,22 +607,39 @@ class VitalSignsMonitor:
         if self.data:
             self.data.disconnect()
         if self.log_file:
+            self._flush_log()
             self.log_file.close()
+            self.log_file = None
 
     def start_logging(self, filepath):
         """Start logging to CSV file"""
-        self.log_file = open(filepath, 'w')
-        self.log_file.write("timestamp,frame,heart_rate,breathing_rate,deviation,valid,range_bin,target_id\n")
+        self.log_file = open(filepath, 'w', buffering=1 << 16)
+        self.log_file.write(LOG_HEADER)
         print(f"{Colors.CYAN}Logging to: {filepath}{Colors.ENDC}")
 
     def _log_vital_signs(self, frame_num, vs):
         """Log vital signs data to file"""
         if self.log_file:
-            timestamp = datetime.now().isoformat()
-            self.log_file.write(f"{timestamp},{frame_num},{vs.heart_rate:.2f},"
-                               f"{vs.breathing_rate:.2f},{vs.breathing_deviation:.6f},"
-                               f"{vs.valid},{vs.range_bin},{vs.target_id}\n")
-            self.log_file.flush()
+            # Local time to the second only changes once per second; reuse it
+            now = time.time()
+            sec = int(now)
+            if sec != self._ts_cached_sec:
+                self._ts_cached_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec))
+                self._ts_cached_sec = sec
+            self.log_file.write(LOG_ROW_FORMAT % (
+                self._ts_cached_prefix, int((now - sec) * 1e6), frame_num, vs.heart_rate,
+                vs.breathing_rate, vs.breathing_deviation,
+                vs.valid, vs.range_bin, vs.target_id))
+
+    def _flush_log(self):
+        """Flush buffered log rows to the OS"""
+        self.log_file.flush()
+        self._log_last_flush = time.monotonic()
+
+    def _flush_log_if_due(self):
+        """Flush the log if LOG_FLUSH_INTERVAL has passed since the last flush"""
+        if self.log_file and time.monotonic() - self._log_last_flush >= LOG_FLUSH_INTERVAL:
+            self._flush_log()
 
     def _print_header(self):
         """Print display header"""
@@ -519,12 +660,19 @@ class VitalSignsMonitor:
             self.br_history.append(vs.breathing_rate)
 
         # Calculate averages
-        avg_hr = sum(self.hr_history) / len(self.hr_history) if self.hr_history else 0
-        avg_br = sum(self.br_history) / len(self.br_history) if self.br_history else 0
+        avg_hr = self.hr_history.mean
+        avg_br = self.br_history.mean
 
         # Clear line and print
-        print(f"\r{Colors.CYAN}Frame {frame_num:6d}{Colors.ENDC} | {vs} | "
-              f"Avg: HR={avg_hr:5.1f} BR={avg_br:4.1f}", end='', flush=True)
+        self._write_status(self._vs_status_format % (frame_num, vs, avg_hr, avg_br))
+
+    def _write_status(self, line):
+        """Write an in-place status line, bypassing print() on a terminal"""
+        if self._stdout_fd is not None:
+            os.write(self._stdout_fd, line.encode())
+        else:
+            sys.stdout.write(line)
+            sys.stdout.flush()
 
     def _print_stats(self):
         """Print statistics"""
@@ -534,9 +682,11 @@ class VitalSignsMonitor:
             print(f"  Frames with VS:  {self.data.frames_with_vs}")
             print(f"  Frame rate:      {self.data.frame_rate:.1f} Hz")
             if self.hr_history:
-                print(f"  Avg Heart Rate:  {sum(self.hr_history)/len(self.hr_history):.1f} BPM")
+                print(f"  Avg Heart Rate:  {self.hr_history.mean:.1f} BPM")
             if self.br_history:
-                print(f"  Avg Breath Rate: {sum(self.br_history)/len(self.br_history):.1f} BPM")
+                print(f"  Avg Breath Rate: {self.br_history.mean:.1f} BPM")
+            if self._vs_err_count:
+                print(f"  VS parse errors: {self._vs_err_count}")
 
     def run_monitor(self):
         """Run the main monitor loop"""
@@ -545,32 +695,28 @@ class VitalSignsMonitor:
 
         print(f"{Colors.CYAN}Monitoring... Press Ctrl+C to stop{Colors.ENDC}\n")
 
+        # Pick the per-frame handler once for the selected display mode
+        if self.display_mode == 'all_tlvs':
+            handle_frame = self._handle_all_tlvs_frame
+        else:
+            handle_frame = self._handle_vs_frame
+        get_frame = self.data.get_frame if self.data else None
+        flush_log_if_due = self._flush_log_if_due
+
         try:
             while self.running:
-                if not self.data:
+                if get_frame is None:
                     time.sleep(0.1)
                     continue
 
-                frame_data = self.data.get_frame(timeout=0.1)
-                if frame_data is None:
-                    continue
-
-                header, tlvs = frame_data
+                # get_frame sleeps on the parser's event; the timeout only
+                # bounds how long an idle loop waits, Ctrl-C still interrupts
+                frame_data = get_frame(timeout=1.0)
+                if frame_data is not None:
+                    handle_frame(*frame_data)
 
-                # Process vital signs TLV
-                if 0x410 in tlvs:
-                    try:
-                        vs = VitalSignsData(tlvs[0x410])
-                        self._print_vital_signs(header.frame_number, vs)
-                        self._log_vital_signs(header.frame_number, vs)
-                    except ValueError as e:
-                        print(f"\r{Colors.RED}VS parse error: {e}{Colors.ENDC}")
-
-                # Show other TLVs in verbose mode
-                elif self.display_mode == 'all_tlvs':
-                    tlv_names = [TLV_TYPES.get(t, f"0x{t:X}") for t in tlvs.keys()]
-                    print(f"\rFrame {header.frame_number:6d} | Objects: {header.num_detected_obj:3d} | "
-                          f"TLVs: {', '.join(tlv_names)}", end='', flush=True)
+                # Checked every pass, so rows reach the file even when VS frames stop
+                flush_log_if_due()
 
         except KeyboardInterrupt:
             print(f"\n\n{Colors.YELLOW}Stopping...{Colors.ENDC}")
@@ -579,6 +725,31 @@ class VitalSignsMonitor:
             self.running = False
             self._print_stats()
 
+    def _handle_vs_frame(self, header, tlvs):
+        """Show and log the vital signs TLV; returns False if the frame has none"""
+        vs_payload = tlvs.get(TLV_TYPE_VITALSIGNS)
+        if vs_payload is None:
+            return False
+        vs = VitalSignsData.try_parse(vs_payload)
+        if vs is None:
+            self._vs_err_count += 1
+        else:
+            self._print_vital_signs(header.frame_number, vs)
+            self._log_vital_signs(header.frame_number, vs)
+        return True
+
+    def _handle_all_tlvs_frame(self, header, tlvs):
+        """Like _handle_vs_frame, but summarize the TLVs of frames without VS"""
+        if self._handle_vs_frame(header, tlvs):
+            return
+        # Frames usually repeat the same TLV set; only rejoin when it changes
+        sig = tuple(tlvs)
+        if sig != self._tlv_sig:
+            self._tlv_sig = sig
+            self._tlv_sig_names = ', '.join(map(_tlv_name, sig))
+        self._write_status(f"\rFrame {header.frame_number:6d} | Objects: {header.num_detected_obj:3d} | "
+                           f"TLVs: {self._tlv_sig_names}")
+
     def run_interactive(self):
         """Run interactive CLI mode"""
         if not self.cli:
@@ -599,9 +770,13 @@ class VitalSignsMonitor:
         print("  quit          - Exit")
         print()
 
-        # Start data parser in background if available
+        # Start data display in background if available; it wakes as soon
+        # as the parser queues a frame and exits once running is cleared
+        self.running = True
+        display_thread = None
         if self.data:
-            threading.Thread(target=self._background_data_display, daemon=True).start()
+            display_thread = threading.Thread(target=self._background_data_display, daemon=True)
+            display_thread.start()
 
         try:
             while True:
@@ -620,9 +795,7 @@ class VitalSignsMonitor:
                     if len(parts) > 1:
                         cfg_file = parts[1]
                     else:
-                        # Default config file
-                        script_dir = os.path.dirname(os.path.abspath(__file__))
-                        cfg_file = os.path.join(script_dir, '..', 'configs', 'chirp_profiles', 'vital_signs_2m.cfg')
+                        cfg_file = _DEFAULT_CFG
                     if os.path.exists(cfg_file):
                         self.cli.send_config_file(cfg_file)
                     else:
@@ -664,6 +837,11 @@ class VitalSignsMonitor:
         except KeyboardInterrupt:
             print()
 
+        finally:
+            self.running = False
+            if display_thread:
+                display_thread.join(timeout=1)
+
     def _background_data_display(self):
         """Background thread to display data while in interactive mode"""
         while self.running:
@@ -672,13 +850,14 @@ class VitalSignsMonitor:
             frame_data = self.data.get_frame(timeout=0.5)
             if frame_data:
                 header, tlvs = frame_data
-                if 0x410 in tlvs:
-                    try:
-                        vs = VitalSignsData(tlvs[0x410])
+                vs_payload = tlvs.get(TLV_TYPE_VITALSIGNS)
+                if vs_payload is not None:
+                    vs = VitalSignsData.try_parse(vs_payload)
+                    if vs is None:
+                        self._vs_err_count += 1
+                    else:
                         # Print on new line to not interfere with input
-                        print(f"\n  {Colors.DIM}[Frame {header.frame_number}] {vs}{Colors.ENDC}")
-                    except:
-                        pass
+                        print(f"\n  {_C_DIM}[Frame {header.frame_number}] {vs}{_C_END}")
 
     def _show_help(self):
         """Show CLI help"""